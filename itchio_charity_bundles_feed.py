@@ -9,14 +9,25 @@
 #
 # Charity-only matching (no "submit" keyword required).
 # Fresh-only filter for BLOG/BOARD items and date-aware pubDate.
+#
+# Fetching is async (aiohttp): all per-source, per-thread, and per-jam-page
+# GETs run concurrently, bounded by a semaphore so we stay polite to itch.io.
 
-import re, json, time, hashlib, datetime as dt
+import re, hashlib, datetime as dt
+import asyncio
+import os
 from pathlib import Path
 from urllib.parse import urljoin, urlparse, parse_qs, urlencode, urlunparse
 
-import requests
-from bs4 import BeautifulSoup as BS
-from xml.etree.ElementTree import Element, SubElement, ElementTree
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from selectolax.lexbor import LexborHTMLParser
+from xml.sax.saxutils import escape
+
+try:
+    import ahocorasick  # optional: single-pass keyword scanning
+except ImportError:
+    ahocorasick = None
 
 USER_AGENT = "itchio-charity-watcher/2.0"
 OUT_FEED = Path("feed.xml")
@@ -29,12 +40,53 @@ MAX_AGE_DAYS = 30
 MAX_JAMS_PAGES = 5          # increase if you want deeper crawl
 MAX_JAMS_PER_PAGE = 60      # safety cap per page
 MAX_JAMS_TOTAL = 400        # overall safety cap per run across all jam lists
+# Max in-flight requests (politeness cap for concurrent fetching):
+MAX_CONCURRENCY = 8
+# Drop seen-state entries not spotted for this many days, so the state file
+# (and the set we load/save each run) stays bounded:
+SEEN_PRUNE_DAYS = 180
+# Hard cap on retained ids (keeps the newest) in case the crawl ever surfaces
+# more than the age window alone would bound:
+SEEN_MAX_IDS = 10000
+# On-disk HTTP cache (SQLite). Honors ETag/Last-Modified so unchanged pages
+# revalidate as cheap 304s instead of full downloads. Jam pages rarely change;
+# the blog index and board threads churn faster, so they get shorter TTLs.
+HTTP_CACHE = Path(".http_cache.sqlite")
+HTTP_CACHE_TTL = 3600
+HTTP_CACHE_URL_TTLS = {
+    "*/jam/*": 86400,
+    "itch.io/blog": 1800,
+    "*/board/*": 1800,
+}
 
 # --- Keyword filters (charity only) ------------------------------------------
 CHARITY = re.compile(
-    r"\b(charity|fundraiser|donation|relief|mutual aid|non[- ]?profit|benefit|fund(?:\s*raiser)?)\b",
+    r"\b(?:charity|fundraiser|donation|relief|mutual aid|non[- ]?profit|benefit|fund(?:\s*raiser)?)\b",
     re.I,
 )
+# Substring screen for the per-anchor hot loops — plain `in` on a casefolded
+# blob beats re.I's per-char case folding there. CHARITY (word-bounded) still
+# decides jam-page matches, where boundaries matter.
+KEYWORDS = (
+    "charity", "fundraiser", "donation", "relief", "mutual aid",
+    "non-profit", "nonprofit", "non profit", "benefit", "fund raiser", "fundraise",
+)
+
+# With pyahocorasick installed, one automaton pass replaces the
+# one-scan-per-keyword tuple loop; otherwise fall back to plain `in`.
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _k in KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_k, _k)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+def has_charity_term(text: str) -> bool:
+    low = text.casefold()
+    if _KEYWORD_AUTOMATON is not None:
+        return next(_KEYWORD_AUTOMATON.iter(low), None) is not None
+    return any(k in low for k in KEYWORDS)
 
 # --- Sources -----------------------------------------------------------------
 SOURCES = [
@@ -58,10 +110,33 @@ SOURCES = [
 JAMS_SEEN_LINKS = set()
 
 # --- HTTP helpers -------------------------------------------------------------
-def get(url: str) -> str:
-    r = requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=30)
-    r.raise_for_status()
-    return r.text
+# One semaphore bounds all in-flight requests; the polite delay lives inside
+# the guarded section so concurrency never hammers the host. A second cap for
+# parse workers lets CPU-bound parsing overlap network RTTs without flooding
+# the thread pool. Both are (re)created in main() so they belong to the
+# running event loop — module-scope semaphores bind to the first loop they're
+# awaited on and break any later asyncio.run() in the same process.
+SEM: asyncio.Semaphore
+PARSE_SEM: asyncio.Semaphore
+
+# Per-run memo: the same URL can be reached via several listings/threads;
+# fetch and evaluate each exactly once per run. Cleared at the end of main().
+_HTML_CACHE: dict[str, str] = {}
+_JAM_MATCH_CACHE: dict[str, tuple[bool, str, str]] = {}
+_POST_TS_CACHE: dict[str, dt.datetime | None] = {}
+
+async def get(session: aiohttp.ClientSession, url: str) -> str:
+    cached = _HTML_CACHE.get(url)
+    if cached is not None:
+        return cached
+    async with SEM:
+        async with session.get(url) as r:
+            r.raise_for_status()
+            text = await r.text()
+        if not getattr(r, "from_cache", False):
+            await asyncio.sleep(1)  # polite per-slot pacing — network hits only
+    _HTML_CACHE[url] = text
+    return text
 
 def to_abs(href: str) -> str:
     if not href:
@@ -81,10 +156,10 @@ def parse_iso_any(ts: str):
     except Exception:
         return None
 
-def find_page_timestamp(soup: BS):
+def find_page_timestamp(tree: LexborHTMLParser):
     """Try to find a meaningful published/updated time on blog/thread pages."""
-    for t in soup.select("time[datetime]"):
-        d = parse_iso_any(t.get("datetime", "").strip())
+    for t in tree.css("time[datetime]"):
+        d = parse_iso_any((t.attributes.get("datetime") or "").strip())
         if d:
             return d if d.tzinfo else d.replace(tzinfo=dt.timezone.utc)
     for sel in [
@@ -94,9 +169,9 @@ def find_page_timestamp(soup: BS):
         "meta[itemprop='datePublished']",
         "meta[itemprop='dateModified']",
     ]:
-        m = soup.select_one(sel)
-        if m and m.get("content"):
-            d = parse_iso_any(m["content"].strip())
+        m = tree.css_first(sel)
+        if m and m.attributes.get("content"):
+            d = parse_iso_any(m.attributes["content"].strip())
             if d:
                 return d if d.tzinfo else d.replace(tzinfo=dt.timezone.utc)
     return None
@@ -109,7 +184,14 @@ def within_age(ts, days: int = MAX_AGE_DAYS) -> bool:
 
 # --- Jam listing parsing (exclude 'Ended …' AND follow jam pages) ------------
 # Widen hints to include "opens in"
-JAM_STATUS_HINT = re.compile(r"(Starts in|Submission closes in|Ends in|Closes in|Submission opens in|Opens in|Ended)", re.I)
+JAM_STATUS_HINT = re.compile(r"(?:Starts in|Submission closes in|Ends in|Closes in|Submission opens in|Opens in|Ended)", re.I)
+# Compiled once; the card loop runs these per anchor and re.compile's
+# internal cache lookup is measurable there.
+ENDED_RE  = re.compile(r"\bEnded\b", re.I)
+STARTS_RE = re.compile(r"\bStarts in\b", re.I)
+CLOSES_RE = re.compile(r"\bSubmission closes in\b", re.I)
+ENDS_RE   = re.compile(r"\b(?:Ends in|Closes in)\b", re.I)
+OPENS_RE  = re.compile(r"\b(?:Submission opens in|Opens in)\b", re.I)
 
 def parse_iso(ts: str):
     try:
@@ -119,24 +201,57 @@ def parse_iso(ts: str):
     except Exception:
         return None
 
+# Whitespace collapse runs on every extracted text blob; a compiled sub stays
+# in C instead of allocating a split list per call.
+_WS = re.compile(r"\s+")
+
 def extract_text(elem) -> str:
-    return " ".join((elem.get_text(" ") if elem else "").split())
+    return _WS.sub(" ", elem.text(separator=" ") if elem else "").strip()
+
+def _parent_snippet(parent, cache: dict) -> str:
+    """Parent text, memoized per underlying node — sibling anchors in the same
+    card would otherwise rebuild the identical snippet."""
+    if parent is None:
+        return ""
+    key = parent.mem_id  # stable C-node address; Node wrappers are recreated per access
+    snippet = cache.get(key)
+    if snippet is None:
+        snippet = extract_text(parent)[:500]
+        cache[key] = snippet
+    return snippet
 
 def jam_page_matches(full_html: str):
-    """Check full jam page for charity keywords; return (match, summary_text, soup)."""
-    soup = BS(full_html, "html.parser")
+    """Check full jam page for charity keywords; return (match, snippet, title).
+
+    The tree is parsed, mined, and dropped here in one pass — callers get
+    plain strings and never walk it a second time."""
+    # Cheap raw-HTML screen first: no keyword anywhere means no parse needed.
+    if not CHARITY.search(full_html):
+        return False, "", ""
+    tree = LexborHTMLParser(full_html)
     chunks = []
     for sel in [
         ".jam_summary", ".jam_header", ".jam_body", ".jam_about",
         ".formatted_description", ".user_formatted_description", "article"
     ]:
-        for node in soup.select(sel):
+        for node in tree.css(sel):
             chunks.append(extract_text(node))
     if not chunks:
-        chunks.append(extract_text(soup.body))
+        chunks.append(extract_text(tree.body))
     text = " ".join(chunks)
-    match = bool(CHARITY.search(text))
-    return match, text[:280], soup
+    if not CHARITY.search(text):
+        return False, "", ""
+    title = extract_text(tree.css_first("h1, .jam_title, .header_title")) or "Jam"
+    return True, text[:280], title
+
+async def parse_jam(html: str):
+    async with PARSE_SEM:
+        return await asyncio.to_thread(jam_page_matches, html)
+
+async def parse_tree(html: str) -> LexborHTMLParser:
+    """Parse on a worker thread so the event loop keeps servicing fetches."""
+    async with PARSE_SEM:
+        return await asyncio.to_thread(LexborHTMLParser, html)
 
 def set_page(url: str, page_num: int) -> str:
     """Return url with ?page=page_num (preserving existing query)."""
@@ -146,25 +261,43 @@ def set_page(url: str, page_num: int) -> str:
     new_q = urlencode(q, doseq=True)
     return urlunparse((pr.scheme, pr.netloc, pr.path, pr.params, new_q, pr.fragment))
 
-def collect_jam_links_from_listing(base_url: str, max_pages: int, per_page_cap: int, total_cap: int):
-    """Iterate listing pages, collect unique jam links with basic card filtering."""
+async def produce_jam_links(session, base_url: str, queue: asyncio.Queue,
+                            max_pages: int, per_page_cap: int, total_cap: int):
+    """Fetch listing pages concurrently and feed filtered jam links into the
+    queue as each page is processed, so jam workers start before the whole
+    listing crawl finishes."""
     now = dt.datetime.now(dt.timezone.utc)
-    collected = []
-    for p in range(1, max_pages + 1):
-        if len(collected) >= total_cap:
-            break
-        page_url = base_url if p == 1 and "page=" not in base_url else set_page(base_url, p)
+    page_urls = [
+        base_url if p == 1 and "page=" not in base_url else set_page(base_url, p)
+        for p in range(1, max_pages + 1)
+    ]
+    fetches = [asyncio.create_task(get(session, u)) for u in page_urls]
+    try:
+        await _produce_from_fetches(page_urls, fetches, queue, per_page_cap, total_cap, now)
+    finally:
+        # Reap cancelled/orphaned fetches so none of them logs
+        # "Task exception was never retrieved" after we return.
+        for fetch in fetches:
+            fetch.cancel()
+        await asyncio.gather(*fetches, return_exceptions=True)
+
+async def _produce_from_fetches(page_urls, fetches, queue, per_page_cap, total_cap, now):
+    produced = 0
+    for page_url, fetch in zip(page_urls, fetches):
+        if produced >= total_cap:
+            fetch.cancel()
+            continue
         try:
-            html = get(page_url)
+            html = await fetch
         except Exception as e:
             print("WARN listing:", page_url, e)
             continue
-        soup = BS(html, "html.parser")
+        tree = await parse_tree(html)
 
         seen_page = 0
         # Find jam cards via links to /jam/...
-        for a in soup.select("a[href*='/jam/']"):
-            link = to_abs(a.get("href") or "")
+        for a in tree.css("a[href*='/jam/']"):
+            link = to_abs(a.attributes.get("href") or "")
             if not link.startswith("https://itch.io/jam/"):
                 continue
             if link in JAMS_SEEN_LINKS:
@@ -177,22 +310,22 @@ def collect_jam_links_from_listing(base_url: str, max_pages: int, per_page_cap:
                 if container and container.parent:
                     container = container.parent
             text_blob = extract_text(container) if container else (extract_text(anchor) if anchor else "")
-            if re.search(r"\bEnded\b", text_blob, re.I):
+            if ENDED_RE.search(text_blob):
                 continue
 
             # Timestamp from card if any
             ts_val = None
-            t = container.find("time") if container else None
-            if t and t.has_attr("datetime"):
-                ts_val = parse_iso(t["datetime"])
+            t = container.css_first("time[datetime]") if container else None
+            if t:
+                ts_val = parse_iso(t.attributes.get("datetime") or "")
                 if ts_val and ts_val.tzinfo is None:
                     ts_val = ts_val.replace(tzinfo=dt.timezone.utc)
 
             # Status hints
-            starts_in = bool(re.search(r"\bStarts in\b", text_blob, re.I))
-            closes_in = bool(re.search(r"\bSubmission closes in\b", text_blob, re.I))
-            ends_in   = bool(re.search(r"\b(Ends in|Closes in)\b", text_blob, re.I))
-            opens_in  = bool(re.search(r"\b(Submission opens in|Opens in)\b", text_blob, re.I))
+            starts_in = bool(STARTS_RE.search(text_blob))
+            closes_in = bool(CLOSES_RE.search(text_blob))
+            ends_in   = bool(ENDS_RE.search(text_blob))
+            opens_in  = bool(OPENS_RE.search(text_blob))
 
             keep = False
             if ts_val:
@@ -206,48 +339,81 @@ def collect_jam_links_from_listing(base_url: str, max_pages: int, per_page_cap:
                 continue
 
             JAMS_SEEN_LINKS.add(link)
-            collected.append((link, ts_val))
+            await queue.put((link, ts_val))
+            produced += 1
             seen_page += 1
-            if seen_page >= per_page_cap or len(collected) >= total_cap:
+            if seen_page >= per_page_cap or produced >= total_cap:
                 break
 
-        # If a page yields nothing, we can stop early
-        if seen_page == 0 and p > 1:
-            break
-
-        time.sleep(1)  # polite delay between listing pages
-    return collected
+async def jam_worker(session, queue: asyncio.Queue, out: list, label: str):
+    """Consume jam links from the queue, fetch each page, apply full-body checks."""
+    while True:
+        entry = await queue.get()
+        try:
+            if entry is None:
+                return
+            jlink, card_ts = entry
+            # One except around the whole entry: a parse failure must not kill
+            # the worker, or the producer can deadlock on a full queue.
+            try:
+                hit = _JAM_MATCH_CACHE.get(jlink)
+                if hit is None:
+                    jhtml = await get(session, jlink)
+                    hit = await parse_jam(jhtml)
+                    _JAM_MATCH_CACHE[jlink] = hit
+                ok, snippet, title = hit
+                if ok:
+                    out.append({
+                        "title": f"{label} {title}"[:160],
+                        "link": jlink,
+                        "summary": snippet,
+                        "ts": card_ts or dt.datetime.now(dt.timezone.utc)
+                    })
+            except Exception as e:
+                print("WARN jam:", jlink, e)
+        finally:
+            queue.task_done()
 
-def items_from_jams_list(base_url: str, label: str):
-    """Paginate through listing (month/week/in-progress/upcoming), then follow each jam page and apply full-body checks."""
+async def items_from_jams_list(session, base_url: str, label: str):
+    """Paginate through listing (month/week/in-progress/upcoming) and stream
+    each discovered jam page through a bounded worker pool."""
     out = []
-    kept = collect_jam_links_from_listing(
-        base_url, MAX_JAMS_PAGES, MAX_JAMS_PER_PAGE, MAX_JAMS_TOTAL
-    )
-    for jlink, card_ts in kept:
-        try:
-            jhtml = get(jlink)
-            ok, snippet, jsoup = jam_page_matches(jhtml)
-            if ok:
-                title = extract_text(jsoup.select_one("h1, .jam_title, .header_title")) or "Jam"
-                out.append({
-                    "title": f"{label} {title}"[:160],
-                    "link": jlink,
-                    "summary": snippet,
-                    "ts": card_ts or dt.datetime.now(dt.timezone.utc)
-                })
-            time.sleep(1)
-        except Exception as e:
-            print("WARN jam:", jlink, e)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+    workers = [
+        asyncio.create_task(jam_worker(session, queue, out, label))
+        for _ in range(MAX_CONCURRENCY)
+    ]
+    try:
+        await produce_jam_links(
+            session, base_url, queue, MAX_JAMS_PAGES, MAX_JAMS_PER_PAGE, MAX_JAMS_TOTAL
+        )
+    finally:
+        for _ in workers:
+            await queue.put(None)  # sentinel per worker
+        await asyncio.gather(*workers)
     return out
 
 # --- Generic HTML scanning with optional deep-follow for boards ---------------
 THREAD_HREF = re.compile(r"/(community/\d+/\d+|board/\d+/[^/]+/.+)", re.I)
 
-def items_from_html(url: str, html: str, label: str):
-    soup = BS(html, "html.parser")
-    candidates = []
+# Where we know the page layout, scan only anchors inside content containers —
+# nav/footer/user-menu links never hold charity posts. Unknown layouts (or a
+# layout change upstream) fall back to every anchor on the page.
+PAGE_ANCHOR_SELECTORS = (
+    ("https://itch.io/board/", ".community_post a[href], .community_post_body a[href]"),
+    ("https://itch.io/community/", ".community_post a[href], .community_post_body a[href]"),
+)
 
+def content_anchors(url: str, tree: LexborHTMLParser):
+    for prefix, sel in PAGE_ANCHOR_SELECTORS:
+        if url.startswith(prefix):
+            nodes = tree.css(sel)
+            if nodes:
+                return nodes
+            break
+    return tree.css("a[href]")
+
+async def items_from_html(session, url: str, label: str):
     # Jam listings (month/week/in-progress/upcoming) — paginated + deep jam scan
     if url.startswith((
         "https://itch.io/jams/starting-this-month",
@@ -255,65 +421,112 @@ def items_from_html(url: str, html: str, label: str):
         "https://itch.io/jams/in-progress",
         "https://itch.io/jams/upcoming"
     )):
-        return items_from_jams_list(url, label)
+        return await items_from_jams_list(session, url, label)
+
+    html = await get(session, url)
+    # Board indexes still need parsing to discover thread links, but blog and
+    # thread pages with no charity term anywhere can skip the parse entirely.
+    is_board_index = "/board/" in url and THREAD_HREF.search(url) is None
+    if not is_board_index and not CHARITY.search(html):
+        return []
+    tree = await parse_tree(html)
+    candidates = []
 
     # Blog index — prefer real blog post links
     if url.rstrip("/") == "https://itch.io/blog":
-        anchors = soup.select("a[href*='/blog/']") or soup.select("a")
-        for a in anchors:
-            href = to_abs(a.get("href") or "")
+        matched = []
+        parent_text_cache: dict[int, str] = {}
+        seen_hrefs = set()
+        for a in (tree.css("a[href*='/blog/']") or tree.css("a")):
+            href = to_abs(a.attributes.get("href") or "")
+            if not href or href in seen_hrefs:
+                continue
             text = extract_text(a)
-            if not href or not text or not href.startswith("https://itch.io"):
+            if not text or not href.startswith("https://itch.io"):
+                continue
+            seen_hrefs.add(href)
+            parent = a.parent
+            # Anchor text is short — screen it first and only fall back to the
+            # (cached) parent snippet when it misses.
+            snippet = _parent_snippet(parent, parent_text_cache)
+            if not has_charity_term(text) and not has_charity_term(snippet):
                 continue
-            parent = a.find_parent()
-            snippet = extract_text(parent)[:500] if parent else ""
-            blob = f"{text} — {snippet}"
-            if CHARITY.search(blob):
+            # If the index card itself carries a timestamp, gate on it here —
+            # no point fetching a post the card already shows is stale.
+            card_time = parent.css_first("time[datetime]") if parent else None
+            if card_time:
+                card_ts = parse_iso_any((card_time.attributes.get("datetime") or "").strip())
+                if card_ts:
+                    if card_ts.tzinfo is None:
+                        card_ts = card_ts.replace(tzinfo=dt.timezone.utc)
+                    if not within_age(card_ts):
+                        continue
+            matched.append((href, text, snippet))
+
+        async def post_ts(href):
+            if href in _POST_TS_CACHE:
+                return _POST_TS_CACHE[href]
+            ts = None
+            try:
+                if href.startswith("https://itch.io/blog/"):
+                    blog_html = await get(session, href)
+                    ts = find_page_timestamp(await parse_tree(blog_html))
+            except Exception:
                 ts = None
-                try:
-                    if href.startswith("https://itch.io/blog/"):
-                        blog_html = get(href)
-                        blog_soup = BS(blog_html, "html.parser")
-                        ts = find_page_timestamp(blog_soup)
-                except Exception:
-                    ts = None
-                if within_age(ts):
-                    candidates.append({
-                        "title": f"{label} {text}"[:160],
-                        "link": href,
-                        "summary": snippet[:280],
-                        "ts": ts
-                    })
+            _POST_TS_CACHE[href] = ts
+            return ts
+
+        stamps = await asyncio.gather(*(post_ts(href) for href, _, _ in matched))
+        for (href, text, snippet), ts in zip(matched, stamps):
+            if within_age(ts):
+                candidates.append({
+                    "title": f"{label} {text}"[:160],
+                    "link": href,
+                    "summary": snippet[:280],
+                    "ts": ts
+                })
         return candidates
 
     # Board listing — follow thread links one click deep
-    if "/board/" in url and THREAD_HREF.search(url) is None:
+    if is_board_index:
         thread_links = []
-        for a in soup.select("a[href*='/board/']"):
-            href = a.get("href") or ""
+        for a in tree.css("a[href*='/board/']"):
+            href = a.attributes.get("href") or ""
             if THREAD_HREF.search(href or ""):
                 thread_links.append(to_abs(href))
-        for tlink in sorted(set(thread_links)):
-            try:
-                thtml = get(tlink)
-                candidates.extend(items_from_html(tlink, thtml, label))
-                time.sleep(1)  # polite
-            except Exception as e:
-                print("WARN thread:", tlink, e)
+        results = await asyncio.gather(
+            *(items_from_html(session, tlink, label) for tlink in sorted(set(thread_links))),
+            return_exceptions=True,
+        )
+        for tlink, res in zip(sorted(set(thread_links)), results):
+            if isinstance(res, BaseException):
+                print("WARN thread:", tlink, res)
+                continue
+            candidates.extend(res)
         return candidates
 
     # Generic page scan (thread pages land here) — charity-only + date-gate
-    page_ts = find_page_timestamp(soup)
-    for a in soup.select("a"):
-        href = to_abs(a.get("href") or "")
-        text = extract_text(a)
-        if not href or not text or not href.startswith("https://itch.io"):
+    page_ts = find_page_timestamp(tree)
+    if not within_age(page_ts):
+        return candidates  # the date gate fails for every anchor alike — skip the scan
+    parent_text_cache: dict[int, str] = {}
+    # Local bindings skip the per-iteration global lookups; this loop sees
+    # hundreds of anchors per thread page.
+    _abs, _text, _term = to_abs, extract_text, has_charity_term
+    _snippet, _append = _parent_snippet, candidates.append
+    seen_hrefs = set()
+    for a in content_anchors(url, tree):
+        href = _abs(a.attributes.get("href") or "")
+        if not href or href in seen_hrefs:
             continue
-        parent = a.find_parent()
-        snippet = extract_text(parent)[:500] if parent else ""
-        blob = f"{text} — {snippet}"
-        if CHARITY.search(blob) and within_age(page_ts):
-            candidates.append({
+        text = _text(a)
+        if not text or not href.startswith("https://itch.io"):
+            continue
+        seen_hrefs.add(href)
+        parent = a.parent
+        snippet = _snippet(parent, parent_text_cache)
+        if _term(text) or _term(snippet):
+            _append({
                 "title": f"{label} {text}"[:160],
                 "link": href,
                 "summary": snippet[:280],
@@ -322,62 +535,122 @@ def items_from_html(url: str, html: str, label: str):
     return candidates
 
 # --- State, RSS build, main ---------------------------------------------------
-def hash_item(it) -> str:
-    return hashlib.sha1((it["title"] + it["link"]).encode("utf-8")).hexdigest()
+# Seen-state format: a version header line followed by "id last_seen_epoch"
+# per line. No JSON parse, no sort on save; the timestamp lets each run prune
+# entries older than SEEN_PRUNE_DAYS so the file never grows unbounded.
+# Bumping the header drops stale ids from older hash schemes.
+SEEN_HEADER = "#v4"
 
-def load_seen():
+def hash_item(it) -> str:
+    # blake2b is faster than sha1 and 10 bytes is plenty for a dedupe token;
+    # shorter hex also keeps the state file small. The NUL between the fields
+    # keeps ("ab", "c") and ("a", "bc") from colliding.
+    h = hashlib.blake2b(digest_size=10)
+    h.update(it["title"].encode("utf-8"))
+    h.update(b"\0")
+    h.update(it["link"].encode("utf-8"))
+    return h.hexdigest()
+
+def load_seen() -> dict:
     if STATE.exists():
         try:
-            return set(json.loads(STATE.read_text()))
+            lines = STATE.read_text().splitlines()
+            if lines and lines[0] == SEEN_HEADER:
+                seen = {}
+                for line in lines[1:]:
+                    item_id, _, ts = line.partition(" ")
+                    seen[item_id] = int(ts or 0)
+                return seen
+            return {}  # old/foreign format — let it regenerate
         except Exception:
-            return set()
-    return set()
+            return {}
+    return {}
 
-def save_seen(ids):
-    STATE.write_text(json.dumps(sorted(ids)))
+def save_seen(seen: dict):
+    STATE.write_text("\n".join([SEEN_HEADER, *(f"{i} {t}" for i, t in seen.items())]))
 
 def build_rss(items):
+    # Stream straight to disk — no element tree held in memory; escape() covers
+    # the text payloads, everything else is literal markup.
     now = dt.datetime.now(dt.timezone.utc)
-    rss = Element("rss", version="2.0")
-    channel = SubElement(rss, "channel")
-    SubElement(channel, "title").text = "itch.io Charity Bundles — Opportunities"
-    SubElement(channel, "link").text = "https://itch.io"
-    SubElement(channel, "description").text = "Auto-collected posts and jams related to charity/fundraisers on itch.io (fresh-only)."
-    SubElement(channel, "lastBuildDate").text = now.strftime("%a, %d %b %Y %H:%M:%S +0000")
-
-    for it in items:
-        item = SubElement(channel, "item")
-        SubElement(item, "title").text = it["title"]
-        SubElement(item, "link").text = it["link"]
-        SubElement(item, "guid").text = hash_item(it)
-        when = it.get("ts") or now
-        SubElement(item, "pubDate").text = when.strftime("%a, %d %b %Y %H:%M:%S +0000")
-        SubElement(item, "description").text = it.get("summary") or it["title"]
-
-    ElementTree(rss).write(OUT_FEED, encoding="utf-8", xml_declaration=True)
-
-def main():
+    # RFC-822 date for the channel and for items without their own timestamp —
+    # formatted once, not per item.
+    now_str = now.strftime("%a, %d %b %Y %H:%M:%S +0000")
+    with OUT_FEED.open("w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        f.write('<rss version="2.0"><channel>')
+        f.write("<title>itch.io Charity Bundles — Opportunities</title>")
+        f.write("<link>https://itch.io</link>")
+        f.write("<description>Auto-collected posts and jams related to charity/fundraisers on itch.io (fresh-only).</description>")
+        f.write(f"<lastBuildDate>{now_str}</lastBuildDate>")
+
+        for it in items:
+            ts = it.get("ts")
+            when_str = ts.strftime("%a, %d %b %Y %H:%M:%S +0000") if ts else now_str
+            f.write("<item>")
+            f.write(f"<title>{escape(it['title'])}</title>")
+            f.write(f"<link>{escape(it['link'])}</link>")
+            f.write(f"<guid>{hash_item(it)}</guid>")
+            f.write(f"<pubDate>{when_str}</pubDate>")
+            f.write(f"<description>{escape(it.get('summary') or it['title'])}</description>")
+            f.write("</item>")
+
+        f.write("</channel></rss>\n")
+
+async def main():
+    global SEM, PARSE_SEM
+    SEM = asyncio.Semaphore(MAX_CONCURRENCY)
+    PARSE_SEM = asyncio.Semaphore(os.cpu_count() or 2)
+
     seen = load_seen()
-    new_seen = set(seen)
+    now_epoch = int(dt.datetime.now(dt.timezone.utc).timestamp())
+    cutoff = now_epoch - SEEN_PRUNE_DAYS * 86400
+    new_seen = {i: t for i, t in seen.items() if t > cutoff}
     found = []
 
-    for url, label in SOURCES:
-        try:
-            html = get(url)
-            for it in items_from_html(url, html, label):
-                it["id"] = hash_item(it)
-                if it["id"] not in seen:
-                    found.append(it)
-                new_seen.add(it["id"])
-            time.sleep(1)  # polite between sources
-        except Exception as e:
-            print("WARN:", url, e)
+    timeout = aiohttp.ClientTimeout(total=30)
+    cache = SQLiteBackend(
+        cache_name=str(HTTP_CACHE),
+        expire_after=HTTP_CACHE_TTL,
+        urls_expire_after=HTTP_CACHE_URL_TTLS,
+        cache_control=True,
+    )
+    # Everything we fetch lives on itch.io — keep a small pool of persistent
+    # connections so each request rides an existing TLS session instead of
+    # paying the TCP+TLS handshake again.
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENCY * 2, limit_per_host=MAX_CONCURRENCY * 2)
+    async with CachedSession(
+        cache=cache, connector=connector,
+        # Brotli shrinks itch.io's text-heavy HTML well beyond gzip; aiohttp
+        # decodes it transparently with the brotli package installed.
+        headers={"User-Agent": USER_AGENT, "Accept-Encoding": "br, gzip"},
+        timeout=timeout
+    ) as session:
+        results = await asyncio.gather(
+            *(items_from_html(session, url, label) for url, label in SOURCES),
+            return_exceptions=True,
+        )
+
+    for (url, label), res in zip(SOURCES, results):
+        if isinstance(res, BaseException):
+            print("WARN:", url, res)
+            continue
+        for it in res:
+            it["id"] = hash_item(it)
+            if it["id"] not in seen:
+                found.append(it)
+            new_seen[it["id"]] = now_epoch
 
     # Keep the latest ~50
     combined = found[-50:]
     build_rss(combined)
+    if len(new_seen) > SEEN_MAX_IDS:
+        new_seen = dict(sorted(new_seen.items(), key=lambda kv: kv[1])[-SEEN_MAX_IDS:])
     save_seen(new_seen)
+    _HTML_CACHE.clear()
+    _JAM_MATCH_CACHE.clear()
+    _POST_TS_CACHE.clear()
     print(f"Wrote {len(combined)} items to {OUT_FEED}")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())